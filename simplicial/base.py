@@ -20,7 +20,7 @@
 import numpy
 import copy
 import itertools
-from typing import Dict, List, Callable, Set, Tuple, Optional
+from typing import Dict, List, Callable, Set, Tuple, Optional, Iterable
 from simplicial import Representation, ReferenceRepresentation, Simplex, Attributes, Renaming
 
 
@@ -111,6 +111,21 @@ class SimplicialComplex:
         :returns: the name of the new simplex"""
         return self._rep.addSimplex(fs, id, attr)
 
+    def addSimplices(self, ss: Iterable[Tuple[List[Simplex], Simplex, Attributes]]) -> List[Simplex]:
+        """Add several simplices to the complex in one operation. Each
+        simplex is given as a tuple of its faces, name, and attributes,
+        as would be passed to :meth:`addSimplex`, with any name or attributes
+        allowed to be None. The simplices are added in the order given,
+        so the faces of each simplex must either already be in the complex
+        or appear earlier in the collection.
+
+        This is equivalent to calling :meth:`addSimplex` repeatedly,
+        but may be considerably faster for large numbers of simplices.
+
+        :param ss: the faces, name, and attributes of each simplex
+        :returns: a list of the names of the new simplices"""
+        return self._rep.addSimplices(ss)
+
     def isBasis(self, bs: List[Simplex], fatal: bool = False):
         """Return True if the given set of simplices is a basis, that is,
         a set of 0-simplices. The simplices must already exist in the complex.
@@ -249,18 +264,17 @@ class SimplicialComplex:
         # fill-out the defaults
         f = self._createRelabelling(rename)
 
-        # perform the copy, renaming the nodes as they come in
-        ns = []
-        for s in c.simplices():
-            t = f(s)
-            if s != t and self.containsSimplex(t):
-                raise ValueError(f'Copying attempting to re-write {s} to the name of an existing simplex {t}')
-            id = self.addSimplex(id=t,
-                                 fs=list(map(f, c.faces(s))),
-                                 attr=copy.copy(c[s]))
-            ns.append(id)
+        # generate the renamed simplices, checking each as it comes in
+        def renamed():
+            for s in c.simplices():
+                t = f(s)
+                if s != t and self.containsSimplex(t):
+                    raise ValueError(f'Copying attempting to re-write {s} to the name of an existing simplex {t}')
+                yield (list(map(f, c.faces(s))), t, copy.copy(c[s]))
 
-        return ns
+        # perform the copy in one operation, as the simplices
+        # arrive in order
+        return self.addSimplices(renamed())
 
     def barycentricSubdivide(self, simplex: Simplex) -> Simplex:
         """Performs Barycentric subdivision on a simplex. This deletes the
@@ -299,13 +313,13 @@ class SimplicialComplex:
             return lambda s: s
         else:
             if isinstance(rename, dict):
-                lookup = lambda s: rename[s] if s in rename.keys() else s
+                lookup = lambda s: rename.get(s, s)
             else:
                 lookup = rename
             newNames = dict()
 
             def newName(s):
-                if s not in newNames.keys():
+                if s not in newNames:
                     newNames[s] = lookup(s)
                 return newNames[s]
 
@@ -456,27 +470,11 @@ class SimplicialComplex:
         # make sure we have a basis
         self.isBasis(bs, fatal=True)
 
-        # find all the simplices arising from the restricted basis
+        # delete all the 0-simplices not in the basis, which cascades
+        # to delete all the simplices they're part of and leaves
+        # only those whose bases lie wholly within the basis
         retain = set(bs)
-        source = set(bs)
-        while True:
-            # find all simplices that are cofaces of the ones we have
-            target = set()
-            for s in source:
-                target.update(self.cofaces(s))
-
-            if target <= retain:
-                # no new simplices found, exit
-                break
-            else:
-                # add new simplices to those to be retained
-                retain.update(target)
-                source = target
-
-        # delete all simplices not in the retention set
-        for s in list(self.simplices()):
-            if self.containsSimplex(s) and s not in retain:
-                self.deleteSimplex(s)
+        self.deleteSimplices([s for s in self.simplicesOfOrder(0) if s not in retain])
 
         return self
 
@@ -610,12 +608,13 @@ class SimplicialComplex:
             if len(orders) > 1:
                 raise ValueError('Faces have varying orders')
 
-        # search for simplex
+        # search for simplex, stopping at the first match since
+        # there can be at most one simplex with a given set of faces
         face_set = set(fs)
-        matches = list(filter(lambda simplex: self.faces(simplex) == face_set,
-                              self.simplicesOfOrder(k)))
-
-        return matches.pop() if matches else None
+        for s in self.simplicesOfOrder(k):
+            if self.faces(s) == face_set:
+                return s
+        return None
 
     def allSimplices(self, p: Callable[['SimplicialComplex', Simplex], bool],
                      reverse: bool = False) -> List[Simplex]:
@@ -1123,7 +1122,6 @@ class SimplicialComplex:
             # build the initial lists of row and column labels, each of which is a
             # list containing just the identifier of the simplex itself
             B = self.boundaryOperator(k)
-            (rb, cb) = B.shape
             rls = list(map((lambda s: [s]), copy.copy(self.simplicesOfOrder(k - 1))))
             cls = list(map((lambda s: [s]), copy.copy(self.simplicesOfOrder(k))))
 
@@ -1131,8 +1129,7 @@ class SimplicialComplex:
             (A, rls, cls) = self._reduceBoundaries(B.copy(), rls, cls)
 
             # compute the ranks of the Z_k group
-            zc = numpy.zeros(rb)
-            kernelDim = [numpy.all(A[:, j] == zc) for j in range(cb)].count(True) # zero columns
+            kernelDim = int(numpy.count_nonzero(~A.any(axis=0)))               # zero columns
 
             # the boundary k-chains correspond to the zero columns
             # in the reduced matrix (the kernelDim rightmost entries)
@@ -1158,22 +1155,16 @@ class SimplicialComplex:
         for k in ks:
             # compute the reduced boundary operator matrices if we
             # haven't already done so
-            if k not in boundaries.keys():
+            if k not in boundaries:
                 boundaries[k] = self.smithNormalForm(k)
             A = boundaries[k]
-            if k + 1 not in boundaries.keys():
+            if k + 1 not in boundaries:
                 boundaries[k + 1] = self.smithNormalForm(k + 1)
             B = boundaries[k + 1]
 
-            # dimensions of boundary matrices
-            (ra, ca) = A.shape
-            (rb, cb) = B.shape
-
             # compute the ranks of the Z_k and B_k groups
-            zc = numpy.zeros(ra)
-            kernelDim = [numpy.all(A[:, j] == zc) for j in range(ca)].count(True) # zero columns
-            zr = numpy.zeros(cb)
-            imageDim = [numpy.all(B[i, :] == zr) for i in range(rb)].count(False) # non-zero rows
+            kernelDim = int(numpy.count_nonzero(~A.any(axis=0)))               # zero columns
+            imageDim = int(numpy.count_nonzero(B.any(axis=1)))                 # non-zero rows
             betti[k] = kernelDim - imageDim
 
         return betti
@@ -1212,10 +1203,10 @@ class SimplicialComplex:
         maxk = max(nss.keys())
         while k <= (maxk + 1):
             k = k + 1
-            if ((k - 1) not in nss.keys()) or (len(nss[k - 1]) == 0):
+            if ((k - 1) not in nss) or (len(nss[k - 1]) == 0):
                 # no new simplices to form faces of any new simplices at this order
                 continue
-            if k not in nss.keys():
+            if k not in nss:
                 # create a new set into which to add created simplex indices
                 nss[k] = set()
 
@@ -1276,7 +1267,7 @@ class SimplicialComplex:
         nss = dict()
         for s in newSimplices:
             (k, i) = self.orderOf(s), self.indexOf(s)
-            if k not in nss.keys():
+            if k not in nss:
                 nss[k] = set([i])
             else:
                 nss[k].add(i)
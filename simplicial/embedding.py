@@ -114,14 +114,17 @@ class Embedding:
         :param s: the simplex
         :returns: the position of the simplex"""
 
-        # check that we're being asked for an 0-simplex
-        if self.complex().orderOf(s) > 0:
+        # check that we're being asked for an 0-simplex (a sanity
+        # check that's skipped when running optimised)
+        if __debug__ and self.complex().orderOf(s) > 0:
             raise ValueError("Can only embed 0-simplices")
 
-        if s not in self._position.keys():
+        p = self._position.get(s)
+        if p is None:
             # no explicit position, so compute it and cache the result
-            self._position[s] = self.computePositionOf(s)
-        return self._position[s]
+            p = self.computePositionOf(s)
+            self._position[s] = p
+        return p
 
     def computePositionOf(self, s: Simplex) -> List[float]:
         """Compute the position of the given 0-simplex under this embedding.
@@ -133,23 +136,49 @@ class Embedding:
         :returns: the position of the simplex"""
         return self.origin()
 
+    def computePositionsOf(self, ss: List[Simplex]) -> List[List[float]]:
+        """Compute the positions of several 0-simplices under this embedding
+        in one operation. The default calls :meth:`computePositionOf` for each
+        simplex in turn: sub-classes with closed-form positioning functions
+        can override this to compute positions in bulk.
+
+        :param ss: the simplices
+        :returns: a list of positions, in the same order as the simplices"""
+        return [self.computePositionOf(s) for s in ss]
+
     def positionsOf(self, ss: Optional[Set[Simplex]] = None) -> Dict[Simplex, List[float]]:
         """Return a dict of positions for a given set of 0-simplices
         in the complex. The default is to return the positions of all
-        0-simplices.
+        0-simplices. Any positions not already known are computed
+        together using :meth:`computePositionsOf`.
 
         :param ss: the simplices (defaults to all 0-simplices)
         :returns: a dict of positions"""
+        c = self.complex()
 
-        # fill in default
+        # fill in default, and make sure we can traverse the
+        # simplices more than once
         if ss is None:
-            ss = self.complex().simplicesOfOrder(0)
+            ss = c.simplicesOfOrder(0)
+        ss = list(ss)
 
-        # retrieve positions and return
-        pos = dict()
+        # find the simplices with no explicit or cached position,
+        # checking that we're only being asked for 0-simplices (a
+        # sanity check that's skipped when running optimised)
+        missing = []
         for s in ss:
-            pos[s] = self.positionOf(s)
-        return pos
+            if __debug__ and c.orderOf(s) > 0:
+                raise ValueError("Can only embed 0-simplices")
+            if s not in self._position:
+                missing.append(s)
+
+        # compute and cache any missing positions in bulk
+        if len(missing) > 0:
+            for (s, p) in zip(missing, self.computePositionsOf(missing)):
+                self._position[s] = p
+
+        # retrieve positions and return
+        return {s: self._position[s] for s in ss}
 
     def clearPositions(self):
         """Clear the cache of simplex positions, forcing them all to be re-computed
@@ -207,24 +236,41 @@ class Embedding:
         c = self.complex()
         vr = SimplicialComplex()
         ss = list(c.simplicesOfOrder(0))
-        for s in ss:
-            vr.addSimplex(id=s)
+        vr.addSimplices([([], s, None) for s in ss])
 
-        # work out all pairs of 0-simplices within eps, adding a
-        # 1-simplex between them
+        # work out the neighbourhood of each 0-simplex, being the
+        # higher-indexed 0-simplices within eps of it
         n = len(ss)
+        pos = self.positionsOf(ss)
+        ps = [pos[s] for s in ss]
+        adj = [set() for _ in range(n)]
         for i in range(n - 1):
-            p = ss[i]
             for j in range(i + 1, n):
-                q = ss[j]
-                if self.distance(self.positionOf(p), self.positionOf(q)) <= eps:
-                    # pair of 0-simplices within eps, add 1-simplex
-                    vr.addSimplexWithBasis([p, q])
-
-        # add higher simplices for collections of 0-simplices
-        # mutally within eps, which is simply the flag complex
-        # derived from the pairwise distances
-        vr2 = vr.flagComplex()
+                if self.distance(ps[i], ps[j]) <= eps:
+                    adj[i].add(j)
+
+        # build the flag complex directly from the neighbourhoods one
+        # order at a time, rather than adding 1-simplices and then
+        # searching for the closed higher simplices afterwards. Each
+        # simplex is keyed by the sorted tuple of indices of its basis,
+        # and can be extended by any 0-simplex in the neighbourhoods
+        # of all its basis elements. The faces of each new simplex
+        # are all of the previous order, so each order can be added
+        # to the complex in bulk
+        simplices = {(i, ): ss[i] for i in range(n)}
+        cliques = [((i, ), adj[i]) for i in range(n)]
+        while len(cliques) > 0:
+            extended = []
+            fss = []
+            for (b, common) in cliques:
+                for j in sorted(common):
+                    bj = b + (j, )
+                    fss.append([simplices[bj[:l] + bj[l + 1:]] for l in range(len(bj))])
+                    extended.append((bj, common & adj[j]))
+            ns = vr.addSimplices([(fs, None, None) for fs in fss])
+            for ((bj, _), s) in zip(extended, ns):
+                simplices[bj] = s
+            cliques = extended
 
         # return the populated complex
-        return vr2
+        return vr
@@ -17,7 +17,8 @@
 # You should have received a copy of the GNU General Public License
 # along with Simplicial. If not, see <http://www.gnu.org/licenses/gpl.html>.
 
-import copy
+import numpy
+from typing import List
 from simplicial import SimplicialComplex, Simplex
 
 
@@ -51,20 +52,26 @@ class EulerIntegrator:
 
     def __init__(self, a: str = None, default_value: int = 0):
         self._attribute = a
-        self._defaultValue = 0
+        self._defaultValue = default_value
 
     def metric(self, c: SimplicialComplex, s: Simplex):
         """Return the metric for the given simplex. The default reads the value
         of the attribute given when the integrator was created: if the simplex
-        has no such attribute then the metric is 0.
+        has no such attribute then the metric is the default value.
 
         :param c: the complex
         :param s: the simplex
         :returns: the metric"""
-        if self._attribute in c[s].keys():
-            return c[s][self._attribute]
-        else:
-            return self._defaultValue
+        return c[s].get(self._attribute, self._defaultValue)
+
+    def metrics(self, c: SimplicialComplex, ss: List[Simplex]) -> numpy.ndarray:
+        """Return the metrics for a list of simplices as an array. The default
+        calls :meth:`metric` for each simplex in turn.
+
+        :param c: the complex
+        :param ss: the simplices
+        :returns: an array of metrics, in the same order as the simplices"""
+        return numpy.array([self.metric(c, s) for s in ss])
 
     def levelSet(self, c: SimplicialComplex, l: int) -> SimplicialComplex:
         """Form the level set of the complex c at the value l. The level set
@@ -73,7 +80,8 @@ class EulerIntegrator:
         complex as long as the metric respects the orders of simplices.
 
         This method is destructive, in that the complex c is reduced to the level
-        set. Be sure to copy the complex first if it's going to be needed later.
+        set. Be sure to copy the complex first (using :meth:`SimplicialComplex.copy`)
+        if it's going to be needed later.
 
         :param c: the complex
         :param l: the level
@@ -81,7 +89,8 @@ class EulerIntegrator:
 
         # extract all the basis simplices whose associated metric
         # is greater than l
-        bs = c.allSimplices(lambda c, s: c.orderOf(s) == 0 and self.metric(c, s) > l)
+        vs = c.simplicesOfOrder(0)
+        bs = [vs[i] for i in numpy.flatnonzero(self.metrics(c, vs) > l)]
 
         # create a sub-complex at this level
         return c.restrictBasisTo(bs)
@@ -90,28 +99,54 @@ class EulerIntegrator:
         """Perform an integration of the Euler characteristic across the
         simplicial complex c under the integrator's metric.
 
+        Rather than forming each level set and computing its Euler
+        characteristic, we compute the vector of changes in the Euler
+        characteristic (VCEC) between successive levels in a single pass.
+        The whole complex is present at level 0, and a simplex is
+        present at level l > 0 if the smallest metric of the 0-simplices
+        in its basis is at least l, so each simplex contributes to
+        every level up to that smallest metric.
+
         :param c: the complex
         :returns: the value of the integral"""
 
-        # the initial level set is the whole complex, and we take a copy
-        # because levelSet() is destructive
-        levelSet = copy.deepcopy(c)
+        # an empty complex has an empty level set at every level
+        if c.maxOrder() < 0:
+            return 0
 
-        # compute maximum "height"
-        maxHeight = max([self.metric(levelSet, s) for s in levelSet.simplices()])
+        # extract the metrics of all simplices, order by order, as
+        # integer levels: a simplex with metric h is still present at
+        # every level l < h + 1, so non-integer metrics round up
+        ms = [numpy.ceil(self.metrics(c, c.simplicesOfOrder(k))).astype(int) for k in range(c.maxOrder() + 1)]
 
-        # perform the integration over the level sets
-        a = 0
-        for l in range(maxHeight):
-            # compute the Euler characteristic of the level set
-            chi = levelSet.eulerCharacteristic()
-            #print('level {level}, chi = {chi}'.format(level = l, chi = chi))
-
-            # add to the integral
-            a += chi
-
-            # form the next level set from this one
-            levelSet = self.levelSet(levelSet, l)
-
-        # return the accumulated integral
-        return a
+        # compute maximum "height"
+        maxHeight = int(max(m.max() for m in ms))
+        if maxHeight <= 0:
+            # no levels to integrate over
+            return 0
+
+        # the levels at which the 0-simplices disappear are their metrics
+        hs = ms[0]
+
+        # accumulate the changes in Euler characteristic, working up the
+        # orders and pushing the disappearance levels up through the boundaries
+        vcec = numpy.zeros(maxHeight + 1, dtype=int)
+        p = 1
+        for k in range(c.maxOrder() + 1):
+            if k > 0:
+                # a k-simplex disappears when the first of its faces does.
+                # Each column of the boundary operator has exactly k + 1
+                # non-zero entries, so we can pull out the indices of the
+                # faces of each simplex without widening the matrix
+                B = c.boundaryOperator(k)
+                fs = numpy.nonzero(B.T)[1].reshape(B.shape[1], k + 1)
+                hs = hs[fs].min(axis=1)
+            vcec += p * numpy.bincount(numpy.clip(hs, 0, maxHeight), minlength=maxHeight + 1)
+            p *= -1
+
+        # the Euler characteristic at each level is the sum of the
+        # changes at that level and above; integrate over the levels,
+        # where those above the largest height of a 0-simplex have
+        # empty level sets and so contribute nothing
+        chis = numpy.cumsum(vcec[::-1])[::-1]
+        return int(chis[:maxHeight].sum())
@@ -88,14 +88,53 @@ class JSONSimplicialComplexEncoder(json.JSONEncoder):
             return json.JSONEncoder.default(self, o)
 
 
-def as_json(c: SimplicialComplex) -> str:
+    def iterencode(self, o: Any, _one_shot: bool = False):
+        """Encode an object as a sequence of strings. A simplicial complex
+        at the top level is streamed out one simplex at a time, so
+        its encoding is never held in memory all at once. Indented
+        encodings, and complexes nested inside other objects, are
+        handled by :meth:`default` in the normal way.
+
+        :param o: the object to encode
+        :param _one_shot: (optional) passed through to the underlying encoder
+        :returns: a generator of strings"""
+        if isinstance(o, SimplicialComplex) and self.indent is None:
+            # write the wrapper
+            ks = self.key_separator
+            yield '{{"__simplicialcomplex__"{ks}true{sep}"__version__"{ks}{v}{sep}"simplices"{ks}['.format(ks=ks,
+                                                                                                    sep=self.item_separator,
+                                                                                                    v=json_simplicial_version)
+
+            # write each simplex
+            sep = ''
+            for s in o.simplices():
+                yield sep
+                yield from json.JSONEncoder.iterencode(self, self.json_simplex(o, s), _one_shot)
+                sep = self.item_separator
+
+            # close the wrapper
+            yield ']}'
+        else:
+            yield from json.JSONEncoder.iterencode(self, o, _one_shot)
+
+
+def as_json(c: SimplicialComplex, pretty: bool = False) -> str:
     """Return a JSON string representation of a simplicial complex.
+    By default the representation is compact: set pretty to True
+    to get an indented and more human-readable (but larger and slower)
+    representation.
 
     :param c: the complex
+    :param pretty: (optional) indent the JSON (defaults to False)
     :returns: a JSON representation of the complex"""
-    return json.dumps(c,
-                      indent=4,
-                      cls=JSONSimplicialComplexEncoder)
+    if pretty:
+        return json.dumps(c,
+                          indent=4,
+                          cls=JSONSimplicialComplexEncoder)
+    else:
+        return json.dumps(c,
+                          separators=(',', ':'),
+                          cls=JSONSimplicialComplexEncoder)
 
 
 def as_simplicial_complex(o: Any) -> Union[SimplicialComplex, Any]:
@@ -109,18 +148,16 @@ def as_simplicial_complex(o: Any) -> Union[SimplicialComplex, Any]:
 
     :param o: the dict
     :returns: a simplicial complex"""
-    if (('__simplicialcomplex__' in o.keys()) and
-        ('__version__' in o.keys()) and
+    if (('__simplicialcomplex__' in o) and
+        ('__version__' in o) and
         (o['__version__'] == json_simplicial_version)):
 
         # create a new complex
         c = SimplicialComplex()
 
-        # import all the simplices into the complex
-        for s in o['simplices']:
-            c.addSimplex(id=s['id'],
-                         fs=s['faces'],
-                         attr=s['attributes'])
+        # import all the simplices into the complex, which we can do
+        # in one operation as they're already in order
+        c.addSimplices([(s['faces'], s['id'], s['attributes']) for s in o['simplices']])
 
         # return the complex
         return c
@@ -130,13 +167,15 @@ def as_simplicial_complex(o: Any) -> Union[SimplicialComplex, Any]:
 
 
 def write_json(c: SimplicialComplex, path: str):
-    """Write a complex in JSON format to the named file.
+    """Write a complex in JSON format to the named file. The
+    simplices are encoded and written one at a time (see
+    :meth:`JSONSimplicialComplexEncoder.iterencode`), so the encoding
+    of the complex is never held in memory all at once.
 
     :param c: the complex
     :param path: path to the file"""
-
     with open(path, 'w') as f:
-        f.write(as_json(c))
+        json.dump(c, f, cls=JSONSimplicialComplexEncoder)
 
 
 def read_json(path: str) -> Union[SimplicialComplex, Any]:
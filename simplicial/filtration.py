@@ -17,7 +17,9 @@
 # You should have received a copy of the GNU General Public License
 # along with Simplicial. If not, see <http://www.gnu.org/licenses/gpl.html>.
 
-from typing import Iterable, Optional, Set, List, Any
+import bisect
+import itertools
+from typing import Iterable, Optional, Set, List, Dict, Tuple, Any
 from simplicial import SimplicialComplex, Simplex, Attributes
 
 
@@ -93,8 +95,54 @@ class Filtration(SimplicialComplex):
         self._appears = dict()      # mapping from simplex to the index value it appears at
         self._includes = dict()     # the reverse mapping, from index to a set of simplices
         self._includes[ind] = set()
-        self._maxOrders = dict()    # maximum orders at each index
-        self._maxOrders[ind] = self.maxOrder()
+        self._maxOrders: Optional[Dict[Any, int]] = {ind: super().maxOrder()}   # maximum orders at each index, if known
+        self._sortedIndices: List[Any] = [ind]           # indices in ascending order
+        self._indexPositions: Dict[Any, int] = {ind: 0}  # mapping from index to its position in the sorted indices
+        self._cumulativeCounts: Optional[List[int]] = None   # number of simplices up to each sorted index, if known
+
+    def _updateIndexPositions(self, i: int):
+        '''Private method to re-compute the positions of sorted indices
+        from the given position onwards, after an index has been added
+        or removed.
+
+        :param i: the first position that has changed'''
+        inds = self._sortedIndices
+        for j in range(i, len(inds)):
+            self._indexPositions[inds[j]] = j
+
+    def _updateMaxOrders(self, ind: Any, k: int):
+        '''Private method to record that a simplex of order k has been
+        added at the given index. The maximum orders never decrease
+        with increasing index, so the new order is propagated to later
+        indices until we reach one whose maximum order is already at
+        least k.
+
+        :param ind: the index
+        :param k: the order of the simplex'''
+        if self._maxOrders is None:
+            # will be re-computed when next needed
+            return
+        inds = self._sortedIndices
+        for j in range(self._indexPositions[ind], len(inds)):
+            i = inds[j]
+            if self._maxOrders[i] >= k:
+                break
+            self._maxOrders[i] = k
+
+    def _computeMaxOrders(self) -> Dict[Any, int]:
+        '''Private method to re-compute the maximum orders at all
+        indices in a single pass, after they have been invalidated
+        by deleting simplices.
+
+        :returns: the maximum orders at each index'''
+        rep = self.representation()
+        maxOrders = dict()
+        k = -1
+        for ind in self._sortedIndices:
+            k = max(k, max((rep.orderOf(s) for s in self._includes[ind]), default=-1))
+            maxOrders[ind] = k
+        self._maxOrders = maxOrders
+        return maxOrders
 
 
     # ---------- Copying ----------
@@ -115,13 +163,7 @@ class Filtration(SimplicialComplex):
         indf = c.getIndex()
         for ind in inds:
             c.setIndex(ind)
-            for s in self.simplicesAddedAtIndex(ind):
-                if self.orderOf(s) == 0:
-                    # 0-simplex, just add it
-                    c.addSimplex(id=s, attr=self[s])
-                else:
-                    # higher simplex, add the faces
-                    c.addSimplex(fs=self.faces(s), id=s, attr=self[s])
+            c.addSimplices([(self.faces(s), s, self[s]) for s in self.simplicesAddedAtIndex(ind)])
         c.setIndex(indf)
         return c
 
@@ -157,7 +199,10 @@ class Filtration(SimplicialComplex):
 
         :param reverse: (optional) reverse the order of the indices (defaults to ascending)
         :returns: the indices'''
-        return sorted(self._includes.keys(), reverse=reverse)
+        if reverse:
+            return self._sortedIndices[::-1]
+        else:
+            return list(self._sortedIndices)
 
     def isIndex(self, ind: int, fatal: bool = False) -> bool:
         '''True is the given value is an index in this filtration.
@@ -165,7 +210,7 @@ class Filtration(SimplicialComplex):
         :param ind: the index
         :param fatal: (optional) make a non-index fatal (defaults to False)
         :returns: True if the index appears in this filtration'''
-        if ind in self._includes.keys():
+        if ind in self._includes:
             return True
         else:
             if fatal:
@@ -180,17 +225,18 @@ class Filtration(SimplicialComplex):
         self._index = ind
 
         # create the necessary data structures
-        if ind not in self._includes.keys():
+        if ind not in self._includes:
             self._includes[ind] = set()
-            ind = self.getIndex()
-            inds = self.indices()
-            i = inds.index(ind)
-            if i > 0:
-                self._maxOrders[ind] = self._maxOrders[inds[i - 1]]
-            else:
-                self._maxOrders[ind] = -1
-
-        self._maxOrder = self._maxOrders[ind]
+            self._cumulativeCounts = None
+            inds = self._sortedIndices
+            i = bisect.bisect_left(inds, ind)
+            inds.insert(i, ind)
+            self._updateIndexPositions(i)
+            if self._maxOrders is not None:
+                if i > 0:
+                    self._maxOrders[ind] = self._maxOrders[inds[i - 1]]
+                else:
+                    self._maxOrders[ind] = -1
 
     def setPreviousIndex(self):
         '''Set the index to the previous value. If we're at the smallest index,
@@ -198,20 +244,19 @@ class Filtration(SimplicialComplex):
 
         :returns: the new index'''
         ind = self.getIndex()
-        inds = self.indices()
-        i = inds.index(ind)
+        i = self._indexPositions[ind]
         if i == 0:
             # currently at the lowest index, do nothing
             return ind
         else:
             # move to the earlier index
-            self._index = inds[ind - 1]
+            self.setIndex(self._sortedIndices[i - 1])
             return self._index
 
     def setMinimumIndex(self):
         '''Set the index of the filtration to its minumum value, selecting
         the smallest complex.'''
-        self.setIndex(self.indices()[0])
+        self.setIndex(self._sortedIndices[0])
 
     def setNextIndex(self):
         '''Set the index to the next value. If we're at the largest index,
@@ -219,20 +264,19 @@ class Filtration(SimplicialComplex):
 
         :returns: the new index'''
         ind = self.getIndex()
-        inds = self.indices()
-        i = inds.index(ind)
-        if i == len(inds) - 1:
+        i = self._indexPositions[ind]
+        if i == len(self._sortedIndices) - 1:
             # currently at the highest index, do nothing
             return ind
         else:
             # move to the next index
-            self._index = inds[ind + 1]
+            self.setIndex(self._sortedIndices[i + 1])
             return self._index
 
     def setMaximumIndex(self):
         '''Set the index of the filtration to its maximum value, selecting
         the largest complex.'''
-        self.setIndex(self.indices()[-1])
+        self.setIndex(self._sortedIndices[-1])
 
 
     # ---------- Adding simplices ----------
@@ -245,13 +289,52 @@ class Filtration(SimplicialComplex):
         :param attr: (optional) dict of attributes
         :returns: the name of the new simplex'''
         nid = super().addSimplex(fs, id, attr)
-        ind = self.getIndex()
-        self._appears[nid] = ind
-        self._includes[ind].add(nid)
-        if self.maxOrder() > self._maxOrders[ind]:
-            self._maxOrders[ind] = self.maxOrder()
+        self._recordSimplex(nid, max(len(fs) - 1, 0))
         return nid
 
+    def addSimplices(self, ss: Iterable[Tuple[List[Simplex], Simplex, Attributes]]) -> List[Simplex]:
+        '''Add several simplices to the filtration at the current index,
+        using the bulk operation of the underlying representation.
+        Each simplex is recorded as appearing at the current index as
+        soon as it has been added, so any simplices added before a
+        failure remain correctly indexed.
+
+        :param ss: the faces, name, and attributes of each simplex
+        :returns: a list of the names of the new simplices'''
+        rep = self.representation()
+        added = []
+
+        def recorded():
+            for (fs, id, attr) in ss:
+                # the representation only asks for the next simplex
+                # once it has added the previous one
+                if len(added) > 0:
+                    self._recordSimplex(*added.pop())
+
+                # name the simplex now so we know what to record
+                k = max(len(fs) - 1, 0)
+                if id is None:
+                    id = rep.newSimplex(k)
+                added.append((id, k))
+                yield (fs, id, attr)
+
+        ns = super().addSimplices(recorded())
+        if len(added) > 0:
+            self._recordSimplex(*added.pop())
+        return ns
+
+    def _recordSimplex(self, s: Simplex, k: int):
+        '''Private method to record that a simplex of order k has
+        appeared at the current index.
+
+        :param s: the simplex
+        :param k: the order of the simplex'''
+        ind = self.getIndex()
+        self._appears[s] = ind
+        self._includes[ind].add(s)
+        self._cumulativeCounts = None
+        self._updateMaxOrders(ind, k)
+
 
     # ---------- Relabelling ----------
 
@@ -265,6 +348,7 @@ class Filtration(SimplicialComplex):
 
         :param s: the simplex'''
         super().forceDeleteSimplex(s)
+        self._maxOrders = None
 
         # in addition to the normal complex, each simplex
         # appears in the appearance index dict and in the
@@ -273,26 +357,44 @@ class Filtration(SimplicialComplex):
         i = self._appears[s]
         del self._appears[s]
         self._includes[i].remove(s)
+        self._cumulativeCounts = None
         if len(self._includes[i]) == 0:
             # last simplex at this index. delete the index
-            # from the inclusion list and the max orders list
+            # from the inclusion list
             del self._includes[i]
-            del self._maxOrders[i]
+            j = self._indexPositions.pop(i)
+            del self._sortedIndices[j]
+            self._updateIndexPositions(j)
 
 
     # ---------- Accessing simplices ----------
 
+    def maxOrderAtIndex(self) -> int:
+        '''Return the largest order of simplices in the filtration
+        at the current index. This may be smaller than the value
+        returned by :meth:`maxOrder`, which is the largest order
+        of simplices in the filtration as a whole.
+
+        :returns: the largest order, or -1 for an empty complex'''
+        maxOrders = self._maxOrders
+        if maxOrders is None:
+            maxOrders = self._computeMaxOrders()
+
+        # the current index may fall between indices that have simplices
+        n = bisect.bisect_right(self._sortedIndices, self.getIndex())
+        if n == 0:
+            return -1
+        return maxOrders[self._sortedIndices[n - 1]]
+
     def orderOf(self, s: Simplex) -> int:
         '''Return the order of the simplex in the filtration. This will raise
         an exception if the simplex isn't defined at the current index.
 
         :param s: the simplex
         :returns: the order of the simplex'''
-        try:
-            return super().orderOf(s)
-        except Exception:
-            # change to a slightly more informative error message
+        if s not in self._appears:
             raise Exception('No simplex {s} in filtration at index {ind}'.format(s=s, ind=self.getIndex()))
+        return super().orderOf(s)
 
     def indexOf(self, s):
         '''Return the index of the simplex in the filtration. This will raise
@@ -300,11 +402,9 @@ class Filtration(SimplicialComplex):
 
         :param s: the simplex
         :returns: the index of the simplex within its order'''
-        try:
-            return super().indexOf(s)
-        except Exception:
-            # change to a slightly more informative error message
+        if s not in self._appears:
             raise Exception('No simplex {s} in filtration at index {ind}'.format(s=s, ind=self.getIndex()))
+        return super().indexOf(s)
 
     def simplices(self, reverse: bool = False) -> Iterable[Simplex]:
         '''Return all the simplices in the filtration at the current index.
@@ -313,39 +413,49 @@ class Filtration(SimplicialComplex):
 
         :param reverse: (optional) reverse sort order (defaults to False)
         :returns: a list of simplices'''
-        return [s for s in super().simplices(reverse) if s in self]
+
+        # collect the simplices added at all indices up to the current one
+        ss = []
+        n = bisect.bisect_right(self._sortedIndices, self.getIndex())
+        for i in itertools.islice(self._sortedIndices, n):
+            ss.extend(self._includes[i])
+
+        # sort into the same order as the underlying complex
+        rep = self.representation()
+        d = -1 if reverse else 1
+        ss.sort(key=lambda s: (d * rep.orderOf(s), rep.indexOf(s)))
+        return ss
 
     def numberOfSimplices(self) -> int:
         '''Return the number of simplices in the filtration up to and including
         the current index.
 
         :returns: the number of simplices'''
-        n = 0
-        ind = self.getIndex()
-        for i in self.indices():
-            if i <= ind:
-                n += len(self._includes[i])
-            else:
-                break
-        return n
+
+        # re-compute the running totals of simplices if they've changed
+        if self._cumulativeCounts is None:
+            self._cumulativeCounts = [0] + list(itertools.accumulate(len(self._includes[i]) for i in self._sortedIndices))
+
+        # look up the total at the current index
+        return self._cumulativeCounts[bisect.bisect_right(self._sortedIndices, self.getIndex())]
 
     def numberOfSimplicesOfOrder(self) -> List[int]:
-        '''Return a dict mapping an order to the number of simplices
-        of that order in the filtratrion up to and including the current index.
+        '''Return a list of the number of simplices of each order in the
+        filtration up to and including the current index.
 
         :returns: a list of number of simplices at each order'''
-        nsos = super().numberOfSimplicesOfOrder()
 
-        # filter out any simplices not defined at the current index
-        empty = set()
-        for k in range(len(nsos)):
-            nsos[k] = len([s for s in nsos[k] if k in self])
-            if nsos[k] == 0:
-                empty.add(k)
+        # count the simplices added at all indices up to the current one
+        rep = self.representation()
+        nsos = [0] * (self.maxOrderAtIndex() + 1)
+        n = bisect.bisect_right(self._sortedIndices, self.getIndex())
+        for i in itertools.islice(self._sortedIndices, n):
+            for s in self._includes[i]:
+                nsos[rep.orderOf(s)] += 1
 
-        # delete any orders emptied by this process
-        for k in empty:
-            del nsos[k]
+        # drop any higher orders that only appear at later indices
+        while len(nsos) > 0 and nsos[-1] == 0:
+            nsos.pop()
 
         return nsos
 
@@ -363,11 +473,12 @@ class Filtration(SimplicialComplex):
         # make sure the index exists
         self.isIndex(ind, fatal=True)
 
-        # retrieve the list of simplices that appeared at this index
-        ss = self._includes[ind].copy()
-
-        # return the simplices sorted by order
-        return sorted(ss, key=lambda s: self.orderOf(s), reverse=reverse)
+        # return the simplices that appeared at this index sorted by
+        # order, taking the orders directly from the representation
+        # since we know the simplices exist (and the sort computes
+        # each order only once). sorted() builds a new list, so the
+        # underlying set can't be changed by the caller
+        return sorted(self._includes[ind], key=self.representation().orderOf, reverse=reverse)
 
     def addedAtIndex(self, s):
         '''Return the  index at which the given simplex was added
@@ -390,7 +501,8 @@ class Filtration(SimplicialComplex):
         is the same or lessa than the current index.
 
         :returns: True if the simplex is in the filtration'''
-        return super().containsSimplex(s) and self._appears[s] <= self.getIndex()
+        ind = self._appears.get(s)
+        return ind is not None and ind <= self.getIndex()
 
     def containsSimplexAtSomeIndex(self, s: Simplex) -> bool:
         '''Test whether the simplex exists in the filtration at some index, ignoring
@@ -18,7 +18,7 @@
 # along with Simplicial. If not, see <http://www.gnu.org/licenses/gpl.html>.
 
 import numpy
-from typing import List, Set
+from typing import List, Set, Tuple, Iterable
 from simplicial import Simplex, Attributes
 
 # There is a circular import between SimplicialComplex and
@@ -73,6 +73,15 @@ class Representation:
         """
         raise NotImplementedError('addSimplex')
 
+    def addSimplices(self, ss: Iterable[Tuple[List[Simplex], Simplex, Attributes]]) -> List[Simplex]:
+        """Add several simplices to the complex. The default adds
+        each simplex in turn using :meth:`addSimplex`: representations
+        may override this with a more efficient bulk operation.
+
+        :param ss: the faces, name, and attributes of each simplex
+        :returns: a list of the names of the new simplices"""
+        return [self.addSimplex(fs, id, attr) for (fs, id, attr) in ss]
+
     def relabelSimplex(self, s: Simplex, q: Simplex):
         '''Relabel a simplex.
 
@@ -18,7 +18,7 @@
 # along with Simplicial. If not, see <http://www.gnu.org/licenses/gpl.html>.
 
 import numpy
-from typing import Dict, Any, List, Set, Tuple
+from typing import Dict, Any, List, Set, Tuple, FrozenSet, Iterable, Callable, Optional
 from simplicial import Simplex, Attributes, Representation
 
 
@@ -77,6 +77,47 @@ class ReferenceRepresentation(Representation):
         :returns: the name of the new simplex
 
         """
+        return self._addSimplex(fs, id, attr, self._complex.simplexWithFaces)
+
+    def addSimplices(self, ss: Iterable[Tuple[List[Simplex], Simplex, Attributes]]) -> List[Simplex]:
+        """Add several simplices to the complex. This performs the same
+        checks as :meth:`addSimplex`, but finds any existing simplex
+        with the same faces using a hash of face sets built once
+        for the whole collection, rather than searching the simplices
+        of the appropriate order for each new simplex.
+
+        :param ss: the faces, name, and attributes of each simplex
+        :returns: a list of the names of the new simplices"""
+        faces: Dict[int, Dict[FrozenSet[Simplex], Simplex]] = dict()
+
+        def simplexWithFaces(fs: List[Simplex]) -> Optional[Simplex]:
+            k = len(fs) - 1
+            for f in fs:
+                if self.orderOf(f) != k - 1:
+                    raise ValueError('Faces have wrong order')
+            if k not in faces:
+                faces[k] = {frozenset(self.faces(s)): s for s in self._indices[k]}
+            return faces[k].get(frozenset(fs))
+
+        ns = []
+        for (fs, id, attr) in ss:
+            s = self._addSimplex(fs, id, attr, simplexWithFaces)
+            k = len(fs) - 1
+            if k > 0:
+                faces.setdefault(k, dict())[frozenset(fs)] = s
+            ns.append(s)
+        return ns
+
+    def _addSimplex(self, fs: List[Simplex], id: Simplex, attr: Attributes,
+                    simplexWithFaces: Callable[[List[Simplex]], Optional[Simplex]]) -> Simplex:
+        """Private method to add a simplex, using the given function to
+        find any existing simplex with the same faces.
+
+        :param fs: a list of faces of the simplex
+        :param id: name for the simplex
+        :param attr: dict of attributes
+        :param simplexWithFaces: function returning an existing simplex with the given faces, or None
+        :returns: the name of the new simplex"""
 
         # work out the order of the new simplex
         k = max(len(fs) - 1, 0)
@@ -124,7 +165,7 @@ class ReferenceRepresentation(Representation):
             # check we don't already have a simplex of this order with
             # the given faces
             if k > 0:
-                swf = self._complex.simplexWithFaces(fs)
+                swf = simplexWithFaces(fs)
                 if swf is not None:
                     raise KeyError(f'Already have simplex {swf} with faces {fs}')
 
@@ -356,7 +397,7 @@ class ReferenceRepresentation(Representation):
 
         :param s: the simplex
         :returns: True if the simplex is in the complex"""
-        return (s in self._simplices.keys())
+        return (s in self._simplices)
 
     def getAttributes(self, s: Simplex) -> Attributes:
         """Return the attributes associated with the given simplex.
@@ -382,18 +423,10 @@ class ReferenceRepresentation(Representation):
             # 0-simplices do not have faces
             return set()
 
-        # extract the column of the boundary matrix
-        #print("boundary for {s} order {k} {b}".format(k = k, s = s, b = self._boundaries[k]))
-        b = (self._boundaries[k])[:, i]
-        #print("boundary of {s} is {b}".format(s = s, b = b))
-
-        # extract the simplex names from this column
-        fs = set()
-        for i in range(len(b)):
-            if b[i] == 1:
-                #print("add index {i} = {id}".format(i = i, id = (self._indices[k - 1])[i]))
-                fs.add((self._indices[k - 1])[i])
-        return fs
+        # extract the simplex names from the non-zero entries in
+        # the simplex's column of the boundary matrix
+        ss = self._indices[k - 1]
+        return {ss[j] for j in numpy.flatnonzero((self._boundaries[k])[:, i])}
 
     def cofaces(self, s: Simplex) -> Set[Simplex]:
         '''Return the simplices the given simnplex is a face of.
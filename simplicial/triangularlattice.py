@@ -17,6 +17,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Simplicial. If not, see <http://www.gnu.org/licenses/gpl.html>.
 
+import numpy
 from typing import List
 from simplicial import SimplicialComplex, Simplex, Embedding
 
@@ -172,3 +173,27 @@ class TriangularLatticeEmbedding(Embedding):
             # shift along for odd-numbered rows
             x = cw * ((j * 2) + 1)
         return [x, y]
+
+    def computePositionsOf(self, ss: List[Simplex]) -> List[List[float]]:
+        """Compute the positions of several simplices at once. This
+        is the vectorised equivalent of :meth:`computePositionOf`.
+
+        :param ss: the simplices
+        :returns: a list of positions, in the same order as the simplices"""
+
+        # extract simplex indices
+        c = self.complex()
+        ns = numpy.array([c.indexOf(s) for s in ss], dtype=int)
+
+        # convert indices to (row, column) co-ordinates
+        nr = c.rows()
+        nc = c.columns()
+        i = ns // nc
+        j = ns % nc
+
+        # compute positions, shifting along for odd-numbered rows
+        rh = (self.height() + 0.0) / nr           # row height
+        cw = (self.width() + 0.0) / (2 * nc)      # column width
+        y = self.height() - rh * i
+        x = cw * ((j * 2) + (i % 2))
+        return numpy.column_stack((x, y)).tolist()
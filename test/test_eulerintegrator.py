@@ -22,6 +22,12 @@ from simplicial import *
 
 class EulerIntegratorTests(unittest.TestCase):
 
+    def testEmpty(self):
+        """Test we can integrate an empty complex."""
+        c = SimplicialComplex()
+        i = EulerIntegrator('height')
+        self.assertEqual(i.integrate(c), 0)
+
     def test0simplex(self):
         """Test we can integrate a single simplex with no height attribute."""
         c = SimplicialComplex()
@@ -43,6 +49,61 @@ class EulerIntegratorTests(unittest.TestCase):
         i = EulerIntegrator('height')
         self.assertEqual(i.integrate(c), 1)
 
+    def test1simplexDefault(self):
+        """Test we use the default value for simplices with no height attribute."""
+        c = SimplicialComplex()
+        c.addSimplex(id = 1)
+        i = EulerIntegrator('height', default_value = 1)
+        self.assertEqual(i.integrate(c), 1)
+
+    def testNegative(self):
+        """Test that simplices with negative heights are counted at level 0."""
+        c = SimplicialComplex()
+        c.addSimplex(id = 1, attr = dict(height = -1))
+        c.addSimplex(id = 2, attr = dict(height = 2))
+        i = EulerIntegrator('height')
+        self.assertEqual(i.integrate(c), 3)
+
+    def testAllNegative(self):
+        """Test that a complex with no positive heights integrates to zero."""
+        c = SimplicialComplex()
+        c.addSimplex(id = 1, attr = dict(height = -1))
+        i = EulerIntegrator('height')
+        self.assertEqual(i.integrate(c), 0)
+
+    def testTriangle(self):
+        """Test we can integrate a triangle whose 0-simplices have different heights."""
+        c = SimplicialComplex()
+        c.addSimplex(id = 1, attr = dict(height = 1))
+        c.addSimplex(id = 2, attr = dict(height = 2))
+        c.addSimplex(id = 3, attr = dict(height = 3))
+        c.addSimplexWithBasis([1, 2, 3], attr = dict(height = 3))
+        i = EulerIntegrator('height')
+        self.assertEqual(i.integrate(c), 3)
+
+    def testLevelSet(self):
+        """Test we form level sets from the 0-simplices above the level."""
+        c = SimplicialComplex()
+        c.addSimplex(id = 1, attr = dict(height = 1))
+        c.addSimplex(id = 2, attr = dict(height = 2))
+        c.addSimplex(id = 3, attr = dict(height = 3))
+        c.addSimplex(id = 12, fs = [ 1, 2 ], attr = dict(height = 2))
+        c.addSimplex(id = 23, fs = [ 2, 3 ], attr = dict(height = 3))
+        i = EulerIntegrator('height')
+        l = i.levelSet(c.copy(), 1)
+        self.assertCountEqual(l.simplices(), [ 2, 3, 23 ])
+        l = i.levelSet(l, 2)
+        self.assertCountEqual(l.simplices(), [ 3 ])
+
+    def testLevelSetFloat(self):
+        """Test we form level sets from non-integer metrics."""
+        c = SimplicialComplex()
+        c.addSimplex(id = 1, attr = dict(height = 1.5))
+        c.addSimplex(id = 2, attr = dict(height = 0.5))
+        i = EulerIntegrator('height')
+        l = i.levelSet(c, 1)
+        self.assertCountEqual(l.simplices(), [ 1 ])
+
 
 if __name__ == '__main__':
     unittest.main()
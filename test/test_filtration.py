@@ -35,6 +35,39 @@ class FiltrationTests(unittest.TestCase):
         f.setIndex(0)
         self.assertCountEqual(f.simplices(), [ 1, 2 ])
 
+    def testAddSimplices(self):
+        '''Test we can add several simplices at an index in one operation.'''
+        f = Filtration()
+        f.addSimplices([ ([], 1, None), ([], 2, None) ])
+        f.setIndex(0.5)
+        f.addSimplices([ ([], 3, None), ([ 1, 2 ], 12, None), ([ 1, 3 ], 13, None) ])
+        self.assertCountEqual(f.simplicesAddedAtIndex(0.5), [ 3, 12, 13 ])
+        self.assertEqual(f.numberOfSimplices(), 5)
+        f.setIndex(0.0)
+        self.assertCountEqual(f.simplices(), [ 1, 2 ])
+
+    def testAddSimplicesUnnamed(self):
+        '''Test we record generated names when adding several simplices.'''
+        f = Filtration()
+        f.addSimplices([ ([], 1, None), ([], 2, None) ])
+        f.setIndex(0.5)
+        ns = f.addSimplices([ ([], None, None), ([ 1, 2 ], None, None) ])
+        self.assertCountEqual(f.simplicesAddedAtIndex(0.5), ns)
+        self.assertCountEqual(f.faces(ns[1]), [ 1, 2 ])
+        f.setIndex(0.0)
+        self.assertCountEqual(f.simplices(), [ 1, 2 ])
+
+    def testAddSimplicesPartial(self):
+        '''Test the simplices added before a failure are still indexed.'''
+        f = Filtration()
+        f.addSimplex(id = 1)
+        f.setIndex(0.5)
+        with self.assertRaises(Exception):
+            f.addSimplices([ ([], 2, None), ([ 1, 2 ], 12, None), ([], 1, None) ])
+        self.assertCountEqual(f.simplicesAddedAtIndex(0.5), [ 2, 12 ])
+        self.assertEqual(f.addedAtIndex(12), 0.5)
+        self.assertEqual(f.maxOrderAtIndex(), 1)
+
     def testAddDuplicateSimplex(self):
         '''Test we can't duplicate simplices at the same or different indices.'''
         f = Filtration()
@@ -173,6 +206,48 @@ class FiltrationTests(unittest.TestCase):
         for s in [ 1, 2, 3, 12, 123 ]:   # there are auto-named simplices too
             self.assertTrue(s in f)
 
+    def testNextPreviousIndices(self):
+        '''Test we can step through non-integer indices.'''
+        f = Filtration()
+        f.addSimplex(id = 1)
+        f.setIndex(0.5)
+        f.addSimplex(id = 2)
+        f.setIndex(1.0)
+        f.addSimplex([1, 2], id = 12)
+        f.setMinimumIndex()
+        self.assertEqual(f.setNextIndex(), 0.5)
+        self.assertCountEqual(f.simplices(), [ 1, 2 ])
+        self.assertEqual(f.setNextIndex(), 1.0)
+        self.assertEqual(f.setNextIndex(), 1.0)
+        self.assertEqual(f.setPreviousIndex(), 0.5)
+        self.assertEqual(f.setPreviousIndex(), 0.0)
+        self.assertEqual(f.setPreviousIndex(), 0.0)
+        self.assertCountEqual(f.simplices(), [ 1 ])
+
+    def testNumberOfSimplices(self):
+        '''Test we count the simplices up to the current index.'''
+        f = Filtration()
+        f.addSimplex(id = 1)
+        f.addSimplex(id = 2)
+        f.setIndex(0.5)
+        f.addSimplex([1, 2], id = 12)
+        f.setIndex(1.0)
+        f.addSimplex(id = 3)
+        f.addSimplex([1, 3], id = 13)
+        f.addSimplex([2, 3], id = 23)
+        f.addSimplex([12, 23, 13], id = 123)
+        self.assertEqual(f.numberOfSimplices(), 7)
+        f.setIndex(0.7)
+        self.assertEqual(f.numberOfSimplices(), 3)
+        f.setIndex(0.5)
+        self.assertEqual(f.numberOfSimplices(), 3)
+        f.setIndex(0.0)
+        self.assertEqual(f.numberOfSimplices(), 2)
+        f.deleteSimplex(2)
+        self.assertEqual(f.numberOfSimplices(), 1)
+        f.setIndex(1.0)
+        self.assertEqual(f.numberOfSimplices(), 3)
+
     def testIndices(self):
         '''Test we can extract the indices.'''
         f = Filtration()
@@ -187,6 +262,22 @@ class FiltrationTests(unittest.TestCase):
         f.addSimplex([12, 23, 13], id = 123)
         self.assertEqual(f.indices(), [ 0.0, 0.5, 1.0 ])
 
+    def testIndicesAfterDeletion(self):
+        '''Test the indices stay sorted as indices are added and removed.'''
+        f = Filtration()
+        f.addSimplex(id = 1)
+        f.addSimplex(id = 2)
+        f.setIndex(1.0)
+        f.addSimplex([1, 2], id = 12)
+        f.setIndex(0.5)
+        f.addSimplex(id = 3)
+        self.assertEqual(f.indices(), [ 0.0, 0.5, 1.0 ])
+        self.assertEqual(f.indices(reverse = True), [ 1.0, 0.5, 0.0 ])
+        f.deleteSimplex(3)
+        self.assertEqual(f.indices(), [ 0.0, 1.0 ])
+        f.setIndex(0.7)
+        self.assertEqual(f.indices(), [ 0.0, 0.7, 1.0 ])
+
     def testCopyFiltration(self):
         '''Test we can copy the filtration.'''
         f = Filtration(0.1)
@@ -270,6 +361,91 @@ class FiltrationTests(unittest.TestCase):
         for i in range(len(cs) - 1):
             self.assertTrue(cs[i] <= cs[i + 1])
 
+    def testNumberOfSimplicesOfOrder(self):
+        '''Test we can count the simplices of each order at different indices.'''
+        f = Filtration()
+        f.addSimplex(id = 1)
+        f.addSimplex(id = 2)
+        f.setIndex(0.5)
+        f.addSimplex([1, 2], id = 12)
+        f.setIndex(1.0)
+        f.addSimplex(id = 3)
+        f.addSimplex([1, 3], id = 13)
+        f.addSimplex([2, 3], id = 23)
+        f.addSimplex([12, 23, 13], id = 123)
+
+        self.assertEqual(f.numberOfSimplicesOfOrder(), [ 3, 3, 1 ])
+        f.setIndex(0.5)
+        self.assertEqual(f.numberOfSimplicesOfOrder(), [ 2, 1 ])
+        f.setIndex(0.0)
+        self.assertEqual(f.numberOfSimplicesOfOrder(), [ 2 ])
+
+    def testMaxOrderAtIndex(self):
+        '''Test the maximum order is that of the complex at the current index.'''
+        f = Filtration()
+        self.assertEqual(f.maxOrderAtIndex(), -1)
+        f.addSimplex(id = 1)
+        f.addSimplex(id = 2)
+        f.setIndex(1.0)
+        f.addSimplex(id = 3)
+        f.addSimplex([1, 2], id = 12)
+        f.addSimplex([1, 3], id = 13)
+        f.addSimplex([2, 3], id = 23)
+        f.setIndex(2.0)
+        f.addSimplex([12, 23, 13], id = 123)
+
+        self.assertEqual(f.maxOrderAtIndex(), 2)
+        f.setIndex(1.5)
+        self.assertEqual(f.maxOrderAtIndex(), 1)
+        f.setIndex(0.0)
+        self.assertEqual(f.maxOrderAtIndex(), 0)
+        f.setIndex(-1.0)
+        self.assertEqual(f.maxOrderAtIndex(), -1)
+
+        # deleting the highest simplices lowers the maximum order
+        f.setIndex(2.0)
+        f.deleteSimplex(12)
+        self.assertEqual(f.maxOrderAtIndex(), 1)
+        f.setIndex(0.0)
+        self.assertEqual(f.maxOrderAtIndex(), 0)
+
+    def testHomologyAtIntermediateIndex(self):
+        '''Test the homology of the whole filtration doesn't depend on the index.'''
+        f = Filtration()
+        f.addSimplex(id = 1)
+        f.addSimplex(id = 2)
+        f.addSimplex(id = 3)
+        f.setIndex(1.0)
+        f.addSimplex([1, 2], id = 12)
+        f.addSimplex([1, 3], id = 13)
+        f.addSimplex([2, 3], id = 23)
+        f.setIndex(2.0)
+        f.addSimplex([12, 23, 13], id = 123)
+
+        # the Euler characteristic only counts simplices at the index
+        for (ind, chi) in [ (0.0, 3), (1.0, 0), (2.0, 1) ]:
+            f.setIndex(ind)
+            self.assertEqual(f.maxOrder(), 2)
+            self.assertEqual(f.bettiNumbers(), {0: 1, 1: 0, 2: 0})
+            self.assertEqual(f.eulerCharacteristic(), chi)
+
+    def testComplexesIndependent(self):
+        '''Test the complexes carry attributes and can be changed independently.'''
+        f = Filtration()
+        f.addSimplex(id = 1, attr=dict(a=1))
+        f.addSimplex(id = 2)
+        f.setIndex(0.5)
+        f.addSimplex([1, 2], id = 12, attr=dict(a=12))
+
+        cs = list(f.complexes())
+        self.assertEqual(cs[0][1]['a'], 1)
+        self.assertEqual(cs[1][12]['a'], 12)
+        cs[1][1]['a'] = 2
+        cs[1].deleteSimplex(2)
+        self.assertEqual(cs[0][1]['a'], 1)
+        self.assertEqual(f[1]['a'], 1)
+        self.assertCountEqual(cs[0].simplices(), [ 1, 2 ])
+
     def testDeletionPreservesInclusion(self):
         '''Test the deletions cascade properly.'''
         f = Filtration()
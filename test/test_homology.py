@@ -18,6 +18,7 @@
 # along with Simplicial. If not, see <http://www.gnu.org/licenses/gpl.html>.
 
 import unittest
+import json
 import numpy
 from simplicial import *
 
@@ -358,6 +359,17 @@ class HomologyTests(unittest.TestCase):
                 else:
                     raise Exception('Incorrect basis')
 
+    def testBettiNumbersAreInts(self):
+        '''Test the Betti numbers are plain integers that can be serialised.'''
+        c = SimplicialComplex()
+        c.addSimplexWithBasis([ 'a', 'b' ])
+        c.addSimplexWithBasis([ 'b', 'c' ])
+        c.addSimplexWithBasis([ 'a', 'c' ])
+        betti = c.bettiNumbers()
+        for k in betti:
+            self.assertIs(type(betti[k]), int)
+        self.assertEqual(json.dumps(betti), '{"0": 1, "1": 1}')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,8 @@ import unittest
 from simplicial import *
 from simplicial.file import *
 import json
+import os
+import tempfile
 
 class JSONTests(unittest.TestCase):
 
@@ -71,6 +73,34 @@ class JSONTests(unittest.TestCase):
         for s in d.simplicesOfOrder(1):
             self.assertCountEqual(d.faces(s), d.faces(s))
 
+    def testPretty( self ):
+        """Test we can read back pretty-printed JSON."""
+        c = SimplicialComplex()
+        c.addSimplexWithBasis(bs = [ 1, 2 ], id = 12)
+        js = as_json(c, pretty = True)
+        self.assertTrue(len(js) > len(as_json(c)))
+        d = json.loads(js, object_hook = as_simplicial_complex)
+
+        self.assertCountEqual(d.simplices(), c.simplices())
+
+    def testFile( self ):
+        """Test we can write and read a complex to and from a file."""
+        c = SimplicialComplex()
+        c.addSimplex(id = 1, attr = dict(name = 'me'))
+        c.addSimplexWithBasis(bs = [ 1, 2, 3 ], id = 123)
+        fd, fn = tempfile.mkstemp(suffix = '.json')
+        os.close(fd)
+        try:
+            write_json(c, fn)
+            d = read_json(fn)
+        finally:
+            os.remove(fn)
+
+        self.assertCountEqual(d.simplices(), c.simplices())
+        self.assertEqual(d[1]['name'], 'me')
+        for s in d.simplices():
+            self.assertCountEqual(d.faces(s), c.faces(s))
+
 
 if __name__ == '__main__':
     unittest.main()
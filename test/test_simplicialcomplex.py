@@ -598,6 +598,36 @@ class SimplicialComplexTests(unittest.TestCase):
         with self.assertRaises(KeyError):
             c.addSimplex(id = 1, fs = [ 1, 2 ])
 
+    def testAddSimplices( self ):
+        """Test we can add several simplices in one operation."""
+        c = SimplicialComplex()
+        c.addSimplex(id = 1)
+        ns = c.addSimplices([ ([], 2, None),
+                              ([], 3, dict(name = 'three')),
+                              ([ 1, 2 ], 12, None),
+                              ([ 2, 3 ], 23, None),
+                              ([ 1, 3 ], 13, None) ])
+        self.assertEqual(ns, [ 2, 3, 12, 23, 13 ])
+        self.assertEqual(c[3]['name'], 'three')
+        self.assertCountEqual(c.faces(13), [ 1, 3 ])
+        c.addSimplices([ ([ 12, 23, 13 ], 123, None) ])
+        self.assertEqual(c.eulerCharacteristic(), 1)
+        self._checkIntegrity(c)
+
+    def testAddSimplicesDuplicates( self ):
+        """Test we detect duplicate simplices when adding several simplices."""
+        c = SimplicialComplex()
+        c.addSimplices([ ([], 1, None), ([], 2, None), ([ 1, 2 ], 12, None) ])
+        with self.assertRaises(KeyError):
+            c.addSimplices([ ([], 2, None) ])
+        with self.assertRaises(KeyError):
+            c.addSimplices([ ([ 1, 2 ], 'again', None) ])
+        with self.assertRaises(KeyError):
+            c.addSimplices([ ([], 3, None), ([ 1, 3 ], 13, None), ([ 3, 1 ], 31, None) ])
+        with self.assertRaises(ValueError):
+            c.addSimplices([ ([ 1, 12 ], 'bad', None) ])
+        self._checkIntegrity(c)
+
     def testCanonical( self ):
         """Test we can pull out simplices in a canonical order."""
         c = SimplicialComplex()
@@ -115,6 +115,26 @@ class TriangularLatticeTests(unittest.TestCase):
         pos1 = e.positionsOf()
         self.assertCountEqual(pos1[s], [ 12, 13 ])
 
+    def testBatchEmbedding( self ):
+        """Test that batch-computed positions match those computed individually."""
+        self._complex = TriangularLattice(5, 5)
+        e = TriangularLatticeEmbedding(self._complex, 11, 11)
+        pos = e.positionsOf()
+        eps = 0.0001
+
+        for s in self._complex.simplicesOfOrder(0):
+            p = e.computePositionOf(s)
+            self.assertTrue(abs(pos[s][0] - p[0]) < eps)
+            self.assertTrue(abs(pos[s][1] - p[1]) < eps)
+
+    def testEmbeddingFromGenerator( self ):
+        """Test that we can ask for the positions of a generated collection of simplices."""
+        self._complex = TriangularLattice(5, 5)
+        e = TriangularLatticeEmbedding(self._complex, 11, 11)
+        ss = list(self._complex.simplicesOfOrder(0))[:5]
+        pos = e.positionsOf(s for s in ss)
+        self.assertCountEqual(pos.keys(), ss)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -93,6 +93,23 @@ class VietorisRipsTests(unittest.TestCase):
         self.assertEqual(len(vr.simplicesOfOrder(0)), 3)
         self.assertEqual(len(vr.simplicesOfOrder(1)), 2)
 
+    def testTetrahedron( self ):
+        """Test we build all the higher simplices when all points are within scale."""
+        c = SimplicialComplex()
+        for s in [1, 2, 3, 4]:
+            c.addSimplex(id = s)
+        em = Embedding(c, dim = 3)
+        em[1] = [0, 0, 0]
+        em[2] = [1, 0, 0]
+        em[3] = [0, 1, 0]
+        em[4] = [0, 0, 1]
+
+        vr = em.vietorisRipsComplex(2)
+
+        self.assertEqual(len(vr.simplices()), 15)
+        self.assertEqual(vr.numberOfSimplicesOfOrder(), [ 4, 6, 4, 1 ])
+        self.assertCountEqual(vr.basisOf(vr.simplicesOfOrder(3)[0]), [ 1, 2, 3, 4 ])
+
 
 if __name__ == '__main__':
     unittest.main()